@@ -3,16 +3,18 @@ from __future__ import annotations
 from pathlib import Path
 from typing import List
 
-import streamlit as st
-
 # Allow running both as module (`python -m streamlit run goodie_bot/ui.py`) and as package
 try:  # when invoked as a package
-    from .cli import ensure_output_dir, load_jobs, load_template_config, process_job
+    from .cli import ensure_output_dir, load_jobs, load_template_config, prepare_template, process_job
 except ImportError:  # when invoked as a script (no package context)
-    from cli import ensure_output_dir, load_jobs, load_template_config, process_job  # type: ignore
+    from cli import ensure_output_dir, load_jobs, load_template_config, prepare_template, process_job  # type: ignore
 
 
 def run_ui() -> None:
+    # Deferred so importing this module (e.g. for the console script) does
+    # not pay streamlit's startup cost until the UI actually runs.
+    import streamlit as st
+
     st.set_page_config(page_title="Goodie Bag Bot", layout="wide")
     st.title("Goodie Bag Bot")
     st.caption("Clean, minimal dashboard. Upload photos, edit text, export cards.")
@@ -70,13 +72,18 @@ def run_ui() -> None:
                         "photos": photo_paths,
                         "output_name": uploaded_output,
                     }
+                    canvas_cfg, photo_boxes, text_blocks, overlays = prepare_template(
+                        template_cfg, font_scale=font_scale_quick
+                    )
                     dest = process_job(
                         job,
-                        template_cfg=template_cfg,
+                        canvas_cfg=canvas_cfg,
+                        photo_boxes=photo_boxes,
+                        text_blocks=text_blocks,
+                        overlays=overlays,
                         output_dir=output_dir_quick,
                         auto_color=not skip_autocolor_quick,
                         dry_run=False,
-                        font_scale=font_scale_quick,
                         remove_bg_jpg=remove_bg_jpg_quick,
                         photo_scale=photo_scale_quick,
                     )
@@ -106,15 +113,20 @@ def run_ui() -> None:
                 st.error(f"Load failed: {exc}")
             else:
                 ensure_output_dir(output_dir)
+                canvas_cfg, photo_boxes, text_blocks, overlays = prepare_template(
+                    template_cfg, font_scale=font_scale_batch
+                )
                 results = []
                 for job in jobs:
                     dest = process_job(
                         job,
-                        template_cfg=template_cfg,
+                        canvas_cfg=canvas_cfg,
+                        photo_boxes=photo_boxes,
+                        text_blocks=text_blocks,
+                        overlays=overlays,
                         output_dir=output_dir,
                         auto_color=not skip_autocolor,
                         dry_run=False,
-                        font_scale=font_scale_batch,
                         remove_bg_jpg=remove_bg_jpg_batch,
                         photo_scale=photo_scale_batch,
                     )